@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import glob as _glob
+from concurrent.futures import ThreadPoolExecutor
 import os
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List
+from typing import Iterator, List
 
 from sneakyagent.models import AgentOutput, AgentTask
+from sneakyagent.utils import compile_globs, iter_files
 
 
 class LLMAdapter(ABC):
@@ -41,12 +45,27 @@ class OpenAIAgentAdapter(LLMAdapter):
         "pyproject.toml",
     ]
 
+    # CONTEXT_GLOBS pre-split at class creation: plain names and literal
+    # paths are matched with O(1) set membership, only the rest needs the
+    # fused wildcard regex.
+    LITERAL_NAMES = frozenset(
+        p for p in CONTEXT_GLOBS if not _glob.has_magic(p) and "/" not in p
+    )
+    LITERAL_PATHS = frozenset(
+        p for p in CONTEXT_GLOBS if not _glob.has_magic(p) and "/" in p
+    )
+    WILDCARD_PATTERNS = tuple(p for p in CONTEXT_GLOBS if _glob.has_magic(p))
+    # Suffix forms of the literal paths so the walk still matches them
+    # nested below the root (Path.match is right-anchored).
+    LITERAL_PATH_SUFFIXES = tuple("/" + p for p in LITERAL_PATHS)
+
     IGNORE_DIRS = {
         ".git", "node_modules", "dist", "build",
         ".venv", "venv", "__pycache__", ".sneakyagent",
     }
 
     MAX_CONTEXT_CHARS = 30000
+    MAX_FILE_CHARS = 4000
 
     def __init__(
         self,
@@ -54,15 +73,31 @@ class OpenAIAgentAdapter(LLMAdapter):
         api_key: str | None = None,
         base_url: str | None = None,
     ) -> None:
-        from openai import OpenAI
+        from openai import AsyncOpenAI
 
         self.model = model
-        self.client = OpenAI(
+        self.client = AsyncOpenAI(
             api_key=api_key or os.environ.get("OPENAI_API_KEY", ""),
             base_url=base_url or os.environ.get("OPENAI_BASE_URL"),
         )
 
     def run(self, repo_path: Path, task: AgentTask) -> AgentOutput:
+        return asyncio.run(self.run_async(repo_path, task))
+
+    def run_many(self, repo_path: Path, tasks: List[AgentTask]) -> List[AgentOutput]:
+        """Run several tasks concurrently so their network round-trips
+        overlap instead of serializing."""
+
+        async def _gather() -> List[AgentOutput]:
+            return list(
+                await asyncio.gather(
+                    *(self.run_async(repo_path, task) for task in tasks)
+                )
+            )
+
+        return asyncio.run(_gather())
+
+    async def run_async(self, repo_path: Path, task: AgentTask) -> AgentOutput:
         model = task.model or self.model
         context = self._build_context(repo_path)
 
@@ -79,7 +114,7 @@ class OpenAIAgentAdapter(LLMAdapter):
             "Please complete the task. Show the code you would write or modify."
         )
 
-        response = self.client.chat.completions.create(
+        response = await self.client.chat.completions.create(
             model=model,
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -104,30 +139,82 @@ class OpenAIAgentAdapter(LLMAdapter):
         )
 
     def _build_context(self, repo_path: Path) -> str:
-        files = self._collect_context(repo_path)
+        # Literal context files cost one stat each; the wildcard patterns
+        # cost a tree walk. Read the literals first and only pay for the
+        # walk when they left at least half the budget unused.
         sections: List[str] = []
         total = 0
-        for rel_path, content in sorted(files.items()):
-            section = f"### {rel_path}\n```\n{content[:4000]}\n```\n"
+        literals = self._literal_candidates(repo_path)
+        total, overflowed = self._fill(sections, total, self._iter_contents(literals))
+        if not overflowed and total < self.MAX_CONTEXT_CHARS * 0.5:
+            seen = {key for key, _ in literals}
+            wildcards = self._wildcard_candidates(repo_path, seen)
+            total, _ = self._fill(sections, total, self._iter_contents(wildcards))
+        return "\n".join(sections) if sections else "(no context files found)"
+
+    def _fill(self, sections: List[str], total: int, contents: Iterator[tuple]) -> tuple:
+        for rel_path, content in contents:
+            section = f"### {rel_path}\n```\n{content}\n```\n"
             if total + len(section) > self.MAX_CONTEXT_CHARS:
-                break
+                return total, True
             sections.append(section)
             total += len(section)
-        return "\n".join(sections) if sections else "(no context files found)"
-
-    def _collect_context(self, repo_path: Path) -> Dict[str, str]:
-        results: Dict[str, str] = {}
-        for fpath in repo_path.rglob("*"):
-            if not fpath.is_file():
-                continue
-            if any(part in self.IGNORE_DIRS for part in fpath.parts):
+        return total, False
+
+    def _literal_candidates(self, repo_path: Path) -> List[tuple]:
+        """Resolve the literal context patterns with one stat each."""
+        candidates: List[tuple] = []
+        for pattern in sorted(self.LITERAL_NAMES | self.LITERAL_PATHS):
+            fpath = repo_path / pattern
+            if fpath.is_file():
+                candidates.append((pattern, fpath))
+        return candidates
+
+    def _wildcard_candidates(self, repo_path: Path, seen: set) -> List[tuple]:
+        """Walk the tree once for everything the remaining patterns match.
+
+        Literal names (README.md, CLAUDE.md, ...) nested below the root
+        are caught here via set membership on the basename, literal paths
+        via a suffix check; only genuine wildcard patterns go through the
+        fused regex."""
+        wildcard_re = compile_globs(self.WILDCARD_PATTERNS)
+        candidates: List[tuple] = []
+        for relative, fpath in iter_files(repo_path, self.IGNORE_DIRS):
+            if relative in seen:
                 continue
-            relative = fpath.relative_to(repo_path)
-            if any(relative.match(pat) for pat in self.CONTEXT_GLOBS):
-                try:
-                    results[str(relative)] = fpath.read_text(
-                        encoding="utf-8", errors="ignore"
-                    )
-                except (OSError, PermissionError):
-                    continue
-        return results
+            name = relative[relative.rfind("/") + 1 :]
+            if (
+                name in self.LITERAL_NAMES
+                or relative.endswith(self.LITERAL_PATH_SUFFIXES)
+                or wildcard_re.match(relative)
+            ):
+                candidates.append((relative, fpath))
+        candidates.sort()
+        return candidates
+
+    def _iter_contents(self, candidates: List[tuple]) -> Iterator[tuple]:
+        """Yield (rel_path, content) in order, reading one thread-pool
+        window ahead so a consumer that stops at its budget wastes at
+        most one window of reads."""
+        window = 8
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            for start in range(0, len(candidates), window):
+                batch = [
+                    (key, executor.submit(self._read_file, fpath))
+                    for key, fpath in candidates[start : start + window]
+                ]
+                for key, future in batch:
+                    text = future.result()
+                    if text is not None:
+                        yield key, text
+
+    def _read_file(self, fpath: str | Path) -> str | None:
+        # Bound the read at the syscall level: anything past MAX_FILE_CHARS
+        # is discarded anyway, so don't pull multi-MB files through the
+        # kernel just to slice them. *4 covers worst-case UTF-8 width.
+        try:
+            with open(fpath, "rb") as fh:
+                data = fh.read(self.MAX_FILE_CHARS * 4)
+        except (OSError, PermissionError):
+            return None
+        return data.decode("utf-8", errors="ignore")[: self.MAX_FILE_CHARS]
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import glob as _glob
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Iterator, List
 
 from sneakyagent.models import AgentOutput, AgentTask
+from sneakyagent.utils import compile_globs, iter_files
 
 
 class MockAgent:
@@ -35,6 +38,20 @@ class MockAgent:
         "package.json",
     ]
 
+    # CONTEXT_GLOBS pre-split at class creation: plain names and literal
+    # paths are matched with O(1) set membership, only the rest needs the
+    # fused wildcard regex.
+    LITERAL_NAMES = frozenset(
+        p for p in CONTEXT_GLOBS if not _glob.has_magic(p) and "/" not in p
+    )
+    LITERAL_PATHS = frozenset(
+        p for p in CONTEXT_GLOBS if not _glob.has_magic(p) and "/" in p
+    )
+    WILDCARD_PATTERNS = tuple(p for p in CONTEXT_GLOBS if _glob.has_magic(p))
+    # Suffix forms of the literal paths so the walk still matches them
+    # nested below the root (Path.match is right-anchored).
+    LITERAL_PATH_SUFFIXES = tuple("/" + p for p in LITERAL_PATHS)
+
     IGNORE_DIRS = {
         ".git", ".hg", ".svn", "node_modules", "dist", "build",
         ".venv", "venv", "__pycache__", ".sneakyagent",
@@ -44,25 +61,28 @@ class MockAgent:
     MAX_TOTAL_CHARS = 50000
 
     def run(self, repo_path: Path, task: AgentTask) -> AgentOutput:
-        context_files = self._collect_context(repo_path)
+        # Enumerate candidates first (cheap), then read lazily in order and
+        # stop as soon as the budget is hit so oversized repos don't pay
+        # for file contents that would be discarded anyway.
+        candidates = self._candidate_paths(repo_path)
         sections: List[str] = [
             "# Mock Agent Output",
             f"Task: {task.task}",
             f"Repo: {repo_path}",
-            f"Context files found: {len(context_files)}",
+            f"Context files found: {len(candidates)}",
             "",
         ]
 
         total = 0
         included = 0
-        for rel_path, content in sorted(context_files.items()):
+        for rel_path, content in self._iter_contents(candidates):
             header = f"--- {rel_path} ---"
-            trimmed = content[: self.MAX_FILE_CHARS]
-            if len(content) > self.MAX_FILE_CHARS:
-                trimmed += f"\n... (truncated, {len(content)} chars total)"
+            trimmed = content
+            if len(content) >= self.MAX_FILE_CHARS:
+                trimmed += "\n... (truncated)"
             section = f"{header}\n{trimmed}\n"
             if total + len(section) > self.MAX_TOTAL_CHARS:
-                remaining = len(context_files) - included
+                remaining = len(candidates) - included
                 sections.append(f"... ({remaining} more files omitted, total limit reached)")
                 break
             sections.append(section)
@@ -72,22 +92,60 @@ class MockAgent:
         combined = "\n".join(sections)
         return AgentOutput(run_id="mock", content=combined, meta={"mode": "offline"})
 
-    def _collect_context(self, repo_path: Path) -> Dict[str, str]:
-        results: Dict[str, str] = {}
-        for fpath in self._iter_files(repo_path):
-            relative = fpath.relative_to(repo_path)
-            if any(relative.match(pat) for pat in self.CONTEXT_GLOBS):
-                try:
-                    text = fpath.read_text(encoding="utf-8", errors="ignore")
-                    results[str(relative)] = text
-                except (OSError, PermissionError):
-                    continue
-        return results
-
-    def _iter_files(self, root: Path):
-        for path in root.rglob("*"):
-            if not path.is_file():
-                continue
-            if any(part in self.IGNORE_DIRS for part in path.parts):
+    def _candidate_paths(self, repo_path: Path) -> List[tuple]:
+        """Enumerate matching context files without reading any of them.
+
+        Root-level literal patterns resolve with one stat each; during the
+        walk, literal names nested below the root are caught via set
+        membership on the basename, literal paths via a suffix check, and
+        only genuine wildcard patterns go through the fused regex."""
+        candidates: List[tuple] = []
+        seen: set = set()
+
+        for pattern in self.LITERAL_NAMES | self.LITERAL_PATHS:
+            fpath = repo_path / pattern
+            if fpath.is_file():
+                seen.add(pattern)
+                candidates.append((pattern, fpath))
+
+        wildcard_re = compile_globs(self.WILDCARD_PATTERNS)
+        for relative, fpath in iter_files(repo_path, self.IGNORE_DIRS):
+            if relative in seen:
                 continue
-            yield path
+            name = relative[relative.rfind("/") + 1 :]
+            if (
+                name in self.LITERAL_NAMES
+                or relative.endswith(self.LITERAL_PATH_SUFFIXES)
+                or wildcard_re.match(relative)
+            ):
+                seen.add(relative)
+                candidates.append((relative, fpath))
+        candidates.sort()
+        return candidates
+
+    def _iter_contents(self, candidates: List[tuple]) -> Iterator[tuple]:
+        """Yield (rel_path, content) in order, reading one thread-pool
+        window ahead so a consumer that stops at its budget wastes at
+        most one window of reads."""
+        window = 8
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            for start in range(0, len(candidates), window):
+                batch = [
+                    (key, executor.submit(self._read_file, fpath))
+                    for key, fpath in candidates[start : start + window]
+                ]
+                for key, future in batch:
+                    text = future.result()
+                    if text is not None:
+                        yield key, text
+
+    def _read_file(self, fpath: str | Path) -> str | None:
+        # Bound the read at the syscall level: anything past MAX_FILE_CHARS
+        # is discarded anyway, so don't pull multi-MB files through the
+        # kernel just to slice them. *4 covers worst-case UTF-8 width.
+        try:
+            with open(fpath, "rb") as fh:
+                data = fh.read(self.MAX_FILE_CHARS * 4)
+        except (OSError, PermissionError):
+            return None
+        return data.decode("utf-8", errors="ignore")[: self.MAX_FILE_CHARS]
@@ -7,6 +7,11 @@ from typing import List, Optional
 
 import typer
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from sneakyagent.agent.runner import AgentRunner
 from sneakyagent.analyze.analyzer import SecurityAnalyzer
 from sneakyagent.models import AgentTask, RunManifest
@@ -53,6 +58,14 @@ def _main(
     logging.basicConfig(level=level, format="%(levelname)s: %(message)s")
 
 
+def _dumps(obj: object, pretty: bool = True) -> str:
+    """Serialize to JSON via orjson when available, stdlib otherwise."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(obj, option=option, default=str).decode()
+    return json.dumps(obj, indent=2 if pretty else None, default=str)
+
+
 def _parse_categories(categories: str) -> List[str]:
     if not categories:
         return []
@@ -91,7 +104,7 @@ def scan(repo: Path) -> None:
     payload = {k: [str(p) for p in v] for k, v in result.layers.items()}
     for layer, files in payload.items():
         logger.info("Layer %s: %d files", layer, len(files))
-    typer.echo(json.dumps(payload, indent=2))
+    typer.echo(_dumps(payload))
 
 
 @app.command(name="list-templates")
@@ -244,9 +257,10 @@ def test(
         if not baseline_path.exists():
             typer.echo(f"baseline agent_output.txt not found for run {baseline_run_id}")
             raise typer.Exit(code=1)
-        baseline_content = baseline_path.read_text(encoding="utf-8")
-        diff_text = analyzer.build_diff(baseline_content, output.content)
-        store.save_artifact("output_diff.txt", diff_text)
+        baseline_content = baseline_store.load_artifact_text("agent_output.txt")
+        store.save_artifact_lines(
+            "output_diff.txt", analyzer.iter_diff(baseline_content, output.content)
+        )
         diff_findings = analyzer.analyze_diff(baseline_content, output.content)
 
     report_data = {
@@ -255,7 +269,7 @@ def test(
         "baseline_run_id": baseline_run_id,
         "diff_findings": [f.__dict__ for f in diff_findings],
     }
-    store.save_artifact("analysis.json", json.dumps(report_data, indent=2))
+    store.save_artifact("analysis.json", _dumps(report_data))
 
     from sneakyagent.report.writer import ReportWriter
 
@@ -284,7 +298,7 @@ def report(repo: Path, run_id: str, format: str = "md") -> None:
     diff_findings = raw.get("diff_findings", [])
 
     if format == "json":
-        typer.echo(json.dumps({"findings": findings, "diff_findings": diff_findings}, indent=2))
+        typer.echo(_dumps({"findings": findings, "diff_findings": diff_findings}))
         return
     if format == "md":
         lines = ["# SneakyAgent Report", ""]
@@ -2,16 +2,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 
 @dataclass
 class ScanResult:
     repo_path: Path
-    layers: Dict[str, List[Path]] = field(default_factory=dict)
+    # Mapping rather than plain dict: the scanner hands back a lazy view
+    # that materializes each layer's paths on first access.
+    layers: Mapping[str, List[Path]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class InsertTemplate:
     id: str
     layer: str
@@ -22,7 +24,7 @@ class InsertTemplate:
     replacements: List["ReplacementRule"] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplacementRule:
     pattern: str
     replacement: str
@@ -41,6 +43,10 @@ class FileMutation:
     before: str
     after: str
     template_id: str
+    # Filled in by RunStore.save_backups so save_manifest can reuse the
+    # digests instead of re-encoding and re-hashing the content.
+    before_sha: Optional[str] = None
+    after_sha: Optional[str] = None
 
 
 @dataclass
@@ -20,20 +20,42 @@ class PatchApplier:
         self, plans: List[MutationPlan], use_llm: bool = False
     ) -> List[FileMutation]:
         results: List[FileMutation] = []
-        # Track original content for files touched multiple times
+        # Each file is read once up front and written once at the end;
+        # intermediate states for files touched by several plans only ever
+        # live in `current`.
         originals: Dict[Path, str] = {}
+        current: Dict[Path, str] = {}
 
-        for plan in plans:
+        # First pass: fire all LLM generations as one concurrent batch so
+        # the wall clock cost is ~max(latency) instead of sum(latency).
+        llm_results: Dict[int, str | Exception] = {}
+        if use_llm:
+            jobs = [
+                (idx, plan)
+                for idx, plan in enumerate(plans)
+                if plan.template.action != "replace"
+            ]
+            if jobs:
+                generated = self.llm_adapter.generate_many(
+                    [(p.template, p.target_path, p.intensity) for _, p in jobs]
+                )
+                llm_results = {idx: res for (idx, _), res in zip(jobs, generated)}
+
+        for idx, plan in enumerate(plans):
             target = plan.target_path
             template = plan.template
 
             # Capture original content before first mutation
             if target not in originals:
                 try:
-                    originals[target] = target.read_text(encoding="utf-8")
+                    text = target.read_text(encoding="utf-8")
                 except (OSError, PermissionError) as exc:
                     logger.warning("Cannot read %s: %s", target, exc)
                     continue
+                originals[target] = text
+                current[target] = text
+            if target not in current:
+                continue  # earlier read failed
 
             if template.action == "replace":
                 replacements = [
@@ -41,33 +63,30 @@ class PatchApplier:
                     for rule in template.replacements
                 ]
                 after = self.mutations.apply_replace(
-                    target, replacements, plan.intensity
+                    current[target], replacements, plan.intensity
                 )
             else:
                 content = template.content
                 if use_llm:
-                    try:
-                        content = self.llm_adapter.generate(
-                            template, target, plan.intensity
+                    generated_content = llm_results.get(idx)
+                    if isinstance(generated_content, Exception):
+                        logger.warning(
+                            "LLM generation failed for %s: %s",
+                            target,
+                            generated_content,
                         )
-                    except Exception as exc:
-                        logger.warning("LLM generation failed for %s: %s", target, exc)
                         # Fall back to template content
+                    elif generated_content is not None:
+                        content = generated_content
                 after = self.mutations.apply_insert(
-                    target, content, plan.intensity
+                    target, current[target], content, plan.intensity
                 )
 
             if after is None:
                 logger.debug("Skipped mutation %s on %s (no change)", template.id, target)
                 continue
 
-            before = target.read_text(encoding="utf-8")
-            try:
-                target.write_text(after, encoding="utf-8")
-            except (OSError, PermissionError) as exc:
-                logger.warning("Cannot write %s: %s", target, exc)
-                continue
-
+            current[target] = after
             results.append(
                 FileMutation(
                     target_path=target,
@@ -76,4 +95,16 @@ class PatchApplier:
                     template_id=plan.template.id,
                 )
             )
+
+        failed: set = set()
+        for target, text in current.items():
+            if text == originals[target]:
+                continue
+            try:
+                target.write_text(text, encoding="utf-8")
+            except (OSError, PermissionError) as exc:
+                logger.warning("Cannot write %s: %s", target, exc)
+                failed.add(target)
+        if failed:
+            results = [m for m in results if m.target_path not in failed]
         return results
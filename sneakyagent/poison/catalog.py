@@ -1,19 +1,27 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Dict, List
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _YamlLoader
+
 from sneakyagent.models import InsertTemplate, ReplacementRule
 
 logger = logging.getLogger(__name__)
 
-REQUIRED_TEMPLATE_FIELDS = {"id", "layer", "category", "target_globs", "content"}
-VALID_ACTIONS = {"insert", "replace"}
-VALID_LAYERS = {
+REQUIRED_TEMPLATE_FIELDS = ("id", "layer", "category", "target_globs", "content")
+VALID_ACTIONS = frozenset({"insert", "replace"})
+VALID_LAYERS = frozenset({
     "ai_instructions",
     "documentation",
     "configuration",
@@ -21,22 +29,58 @@ VALID_LAYERS = {
     "templates",
     "tooling",
     "code_metadata",
-}
+})
+
+# Katalog cache'i: (resolved path, mtime_ns) anahtari ile tekrar eden
+# YAML parse + validasyon maliyetini atlar. Dosya degisirse mtime da
+# degisir, eski giris kullanilmaz.
+_CATALOG_CACHE: Dict[tuple, "RuleCatalog"] = {}
 
 
 @dataclass
 class RuleCatalog:
     templates: List[InsertTemplate]
 
+    def __post_init__(self) -> None:
+        # Kategori/layer indeksleri yukleme sirasinda bir kez kurulur;
+        # by_category/by_layer her cagrida tum listeyi taramak yerine
+        # dogrudan ilgili kovalari okur.
+        by_category: Dict[str, List[InsertTemplate]] = defaultdict(list)
+        by_layer: Dict[str, List[InsertTemplate]] = defaultdict(list)
+        for template in self.templates:
+            by_category[template.category].append(template)
+            by_layer[template.layer].append(template)
+        self._by_category = dict(by_category)
+        self._by_layer = dict(by_layer)
+
     @classmethod
+    @lru_cache(maxsize=None)
     def load_default(cls) -> "RuleCatalog":
+        # Parsed once per process; poison + test in the same pipeline reuse
+        # the same catalog instead of re-reading rules.yaml.
         data_path = Path(__file__).resolve().parent.parent / "data" / "rules.yaml"
         return cls.load_from_path(data_path)
 
+    @classmethod
+    def invalidate(cls) -> None:
+        """Katalog cache'ini temizle (testler icin)."""
+        _CATALOG_CACHE.clear()
+        cls.load_default.cache_clear()
+
     @classmethod
     def load_from_path(cls, path: Path) -> "RuleCatalog":
         try:
-            raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+            cache_key = (path.resolve(), path.stat().st_mtime_ns)
+        except OSError as e:
+            raise FileNotFoundError(
+                f"Rules dosyası bulunamadı: {path}"
+            ) from e
+        cached = _CATALOG_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            raw = yaml.load(path.read_text(encoding="utf-8"), Loader=_YamlLoader)
         except yaml.YAMLError as e:
             raise ValueError(
                 f"YAML parse hatası '{path}': {e}\n"
@@ -69,7 +113,9 @@ class RuleCatalog:
                 continue
 
             # --- gerekli alan kontrolü ---
-            missing = REQUIRED_TEMPLATE_FIELDS - item.keys()
+            # Tuple üzerinde döngü, her template için yeni set üretmekten
+            # daha ucuz; hata mesajı aynı kalıyor.
+            missing = [k for k in REQUIRED_TEMPLATE_FIELDS if k not in item]
             if missing:
                 raise ValueError(
                     f"Template #{idx} (id={item.get('id', '?')}): "
@@ -82,7 +128,7 @@ class RuleCatalog:
                 raise ValueError(
                     f"Template '{item['id']}': "
                     f"geçersiz action '{action}', "
-                    f"beklenen: {VALID_ACTIONS}"
+                    f"beklenen: {', '.join(sorted(VALID_ACTIONS))}"
                 )
 
             # --- layer doğrulama ---
@@ -146,12 +192,19 @@ class RuleCatalog:
             len(templates),
             path.name,
         )
-        return cls(templates=templates)
+        catalog = cls(templates=templates)
+        _CATALOG_CACHE[cache_key] = catalog
+        return catalog
 
     def by_category(self, categories: List[str]) -> List[InsertTemplate]:
         if not categories:
             return self.templates
-        return [t for t in self.templates if t.category in categories]
+        empty: List[InsertTemplate] = []
+        return list(
+            chain.from_iterable(
+                self._by_category.get(category, empty) for category in categories
+            )
+        )
 
     def by_layer(self, layer: str) -> List[InsertTemplate]:
-        return [t for t in self.templates if t.layer == layer]
+        return list(self._by_layer.get(layer, ()))
@@ -1,12 +1,90 @@
 from __future__ import annotations
 
 import random
+from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List
 
 from sneakyagent.models import MutationPlan, ScanResult
 from sneakyagent.poison.catalog import RuleCatalog
 from sneakyagent.poison.strategy import Strategy
+from sneakyagent.utils import compile_globs
+
+_LAYER_WEIGHTS = {
+    "ai_instructions": 3.0,
+    "documentation": 2.0,
+    "configuration": 1.5,
+    "infrastructure": 2.5,
+    "templates": 1.0,
+    "tooling": 0.8,
+    "code_metadata": 1.2,
+}
+
+# intensity -> (stealth threshold, penalty weight)
+_INTENSITY_PARAMS = {
+    "subtle": (2, 1.0),
+    "normal": (4, 0.5),
+    "strong": (8, 0.2),
+}
+
+_MUTATE_ACTIONS = ("swap", "add", "remove")
+
+# 70/30 include/exclude split used when seeding random individuals
+_INCLUDE_WEIGHTS = (7, 10)
+
+
+@dataclass(slots=True)
+class _Individual:
+    """A candidate plan list plus aggregates kept in sync as genes change.
+
+    Category/layer/file tallies are maintained incrementally so fitness
+    reads them directly instead of rescanning every plan on every call.
+    """
+
+    plans: List[MutationPlan] = field(default_factory=list)
+    cats: Counter = field(default_factory=Counter)
+    layers: Counter = field(default_factory=Counter)
+    file_counts: Counter = field(default_factory=Counter)
+
+    def add(self, plan: MutationPlan) -> None:
+        self.plans.append(plan)
+        self.cats[plan.template.category] += 1
+        self.layers[plan.template.layer] += 1
+        self.file_counts[plan.target_path] += 1
+
+    def remove_at(self, idx: int) -> MutationPlan:
+        plan = self.plans.pop(idx)
+        self._forget(plan)
+        return plan
+
+    def replace_at(self, idx: int, plan: MutationPlan) -> None:
+        self._forget(self.plans[idx])
+        self.plans[idx] = plan
+        self.cats[plan.template.category] += 1
+        self.layers[plan.template.layer] += 1
+        self.file_counts[plan.target_path] += 1
+
+    def _forget(self, plan: MutationPlan) -> None:
+        for counter, key in (
+            (self.cats, plan.template.category),
+            (self.layers, plan.template.layer),
+            (self.file_counts, plan.target_path),
+        ):
+            counter[key] -= 1
+            if not counter[key]:
+                del counter[key]
+
+    def copy(self) -> "_Individual":
+        return _Individual(
+            plans=list(self.plans),
+            cats=self.cats.copy(),
+            layers=self.layers.copy(),
+            file_counts=self.file_counts.copy(),
+        )
+
+    def key(self) -> tuple:
+        return tuple((p.template.id, p.target_path) for p in self.plans)
 
 
 class GeneticStrategy(Strategy):
@@ -21,6 +99,8 @@ class GeneticStrategy(Strategy):
         self.generations = generations
         self.mutation_rate = mutation_rate
         self.random = random.Random(seed)  # None = truly random
+        self._layer_str_cache: tuple | None = None
+        self._fit_cache: Dict[tuple, float] = {}
 
     def plan(
         self,
@@ -42,6 +122,10 @@ class GeneticStrategy(Strategy):
         if not target_map:
             return []
 
+        # Intensity is fixed for the whole run, so fitness only depends on
+        # the plan contents; elites carried across generations score in O(1).
+        self._fit_cache.clear()
+
         population = [
             self._random_individual(templates, target_map, intensity)
             for _ in range(self.population_size)
@@ -53,29 +137,49 @@ class GeneticStrategy(Strategy):
             elite_count = max(2, self.population_size // 4)
             elites = [ind for _, ind in scored[:elite_count]]
 
-            offspring: List[List[MutationPlan]] = []
-            while len(offspring) + len(elites) < self.population_size:
-                parent_a = self._tournament(scored)
-                parent_b = self._tournament(scored)
+            # Draw every tournament for this generation in one batch up
+            # front instead of sampling/sorting contenders per offspring.
+            offspring_n = max(0, self.population_size - len(elites))
+            winners = self._tournament_winners(len(scored), 2 * offspring_n)
+
+            offspring: List[_Individual] = []
+            for j in range(offspring_n):
+                parent_a = scored[winners[2 * j]][1]
+                parent_b = scored[winners[2 * j + 1]][1]
                 child = self._crossover(parent_a, parent_b)
                 child = self._mutate(child, templates, target_map, intensity)
                 offspring.append(child)
 
             population = elites + offspring
 
-        best = max(population, key=lambda p: self._fitness(p, intensity), default=[])
-        return best
+        best = max(population, key=lambda p: self._fitness(p, intensity), default=None)
+        return best.plans if best is not None else []
 
     def _build_target_map(
         self, scan: ScanResult, templates: List
     ) -> Dict[str, List[Path]]:
+        # Convert each layer's files to POSIX strings once per ScanResult;
+        # templates sharing a layer then reuse the same string list instead
+        # of paying Path.as_posix per (template, file) pair. The cache
+        # survives repeated plan() calls on the same scan.
+        if self._layer_str_cache is None or self._layer_str_cache[0] is not scan:
+            layer_strs = {
+                layer: (files, [p.as_posix() for p in files])
+                for layer, files in scan.layers.items()
+            }
+            self._layer_str_cache = (scan, layer_strs)
+        else:
+            layer_strs = self._layer_str_cache[1]
+
         target_map: Dict[str, List[Path]] = {}
         for tmpl in templates:
-            candidates = scan.layers.get(tmpl.layer, [])
-            filtered: List[Path] = []
-            for path in candidates:
-                if any(path.match(pat) for pat in tmpl.target_globs):
-                    filtered.append(path)
+            files, strings = layer_strs.get(tmpl.layer, ((), ()))
+            # One cached compiled alternation per glob set instead of
+            # re-parsing every pattern through Path.match for every file.
+            regex = compile_globs(tuple(tmpl.target_globs))
+            filtered = [
+                files[i] for i, rel in enumerate(strings) if regex.match(rel)
+            ]
             if filtered:
                 target_map[tmpl.id] = filtered
         return target_map
@@ -85,129 +189,133 @@ class GeneticStrategy(Strategy):
         templates: List,
         target_map: Dict[str, List[Path]],
         intensity: str,
-    ) -> List[MutationPlan]:
-        plans: List[MutationPlan] = []
-        for tmpl in templates:
+    ) -> _Individual:
+        ind = _Individual()
+        # Randomly include or exclude each template for diversity; the
+        # inclusion coin flips come from one batched choices() call.
+        included = self.random.choices(
+            (True, False), cum_weights=_INCLUDE_WEIGHTS, k=len(templates)
+        )
+        for tmpl, include in zip(templates, included):
             targets = target_map.get(tmpl.id, [])
-            if not targets:
+            if not targets or not include:
                 continue
-            # Randomly include or exclude each template for diversity
-            if self.random.random() < 0.7:
-                chosen = self.random.choice(targets)
-                plans.append(
-                    MutationPlan(template=tmpl, target_path=chosen, intensity=intensity)
-                )
-        return plans
+            chosen = self.random.choice(targets)
+            ind.add(
+                MutationPlan(template=tmpl, target_path=chosen, intensity=intensity)
+            )
+        return ind
+
+    def _fitness(self, ind: _Individual, intensity: str = "normal") -> float:
+        key = ind.key()
+        cached = self._fit_cache.get(key)
+        if cached is None:
+            cached = self._fit_cache[key] = self._compute_fitness(ind, intensity)
+        return cached
 
-    def _fitness(self, plans: List[MutationPlan], intensity: str = "normal") -> float:
-        if not plans:
+    def _compute_fitness(self, ind: _Individual, intensity: str) -> float:
+        if not ind.plans:
             return 0.0
-        layer_weights = {
-            "ai_instructions": 3.0,
-            "documentation": 2.0,
-            "configuration": 1.5,
-            "infrastructure": 2.5,
-            "templates": 1.0,
-            "tooling": 0.8,
-            "code_metadata": 1.2,
-        }
-
-        # Base score: sum of layer weights
-        score = sum(layer_weights.get(p.template.layer, 1.0) for p in plans)
+        # Base score: sum of layer weights, read off the layer tallies
+        score = sum(
+            _LAYER_WEIGHTS.get(layer, 1.0) * count
+            for layer, count in ind.layers.items()
+        )
 
         # Category diversity bonus: more categories covered = better
-        unique_categories = {p.template.category for p in plans}
-        score += len(unique_categories) * 1.5
+        score += len(ind.cats) * 1.5
 
         # Layer diversity bonus
-        unique_layers = {p.template.layer for p in plans}
-        score += len(unique_layers) * 1.0
+        score += len(ind.layers) * 1.0
 
         # Stealth penalty: varies by intensity
-        unique_files = {p.target_path for p in plans}
-        if intensity == "subtle":
-            stealth_threshold = 2
-            penalty_weight = 1.0
-        elif intensity == "strong":
-            stealth_threshold = 8
-            penalty_weight = 0.2
-        else:
-            stealth_threshold = 4
-            penalty_weight = 0.5
-        stealth_penalty = max(0, len(unique_files) - stealth_threshold) * penalty_weight
+        stealth_threshold, penalty_weight = _INTENSITY_PARAMS.get(
+            intensity, _INTENSITY_PARAMS["normal"]
+        )
+        stealth_penalty = (
+            max(0, len(ind.file_counts) - stealth_threshold) * penalty_weight
+        )
         score -= stealth_penalty
 
         # Concentration bonus: multiple mutations in same high-value file
-        file_counts: Dict[Path, int] = {}
-        for p in plans:
-            file_counts[p.target_path] = file_counts.get(p.target_path, 0) + 1
-        for path, count in file_counts.items():
+        for count in ind.file_counts.values():
             if count > 1:
                 score += (count - 1) * 0.3
 
         return score
 
-    def _tournament(self, scored: List[Tuple[float, List[MutationPlan]]]) -> List[MutationPlan]:
-        k = min(4, len(scored))
-        contenders = self.random.sample(scored, k=k)
-        contenders.sort(key=lambda x: x[0], reverse=True)
-        return contenders[0][1]
+    def _tournament_winners(self, n_scored: int, count: int) -> List[int]:
+        # `scored` is sorted by fitness descending, so a tournament winner
+        # is simply the lowest index among the sampled contenders — no
+        # contender list build or re-sort needed per tournament.
+        k = min(4, n_scored)
+        sample = self.random.sample
+        pool = range(n_scored)
+        return [min(sample(pool, k)) for _ in range(count)]
 
-    def _crossover(
-        self, a: List[MutationPlan], b: List[MutationPlan]
-    ) -> List[MutationPlan]:
-        # Uniform crossover: pick each gene from either parent
-        max_len = max(len(a), len(b))
-        child: List[MutationPlan] = []
+    def _crossover(self, a: _Individual, b: _Individual) -> _Individual:
+        # Uniform crossover: pick each gene from either parent. One
+        # getrandbits call supplies the whole coin-flip mask instead of a
+        # random() draw per gene. Aggregates are built as genes land.
+        plans_a, plans_b = a.plans, b.plans
+        max_len = max(len(plans_a), len(plans_b))
+        child = _Individual()
+        if not max_len:
+            return child
+        mask = self.random.getrandbits(max_len)
         for i in range(max_len):
-            if i < len(a) and i < len(b):
-                child.append(a[i] if self.random.random() < 0.5 else b[i])
-            elif i < len(a):
-                if self.random.random() < 0.5:
-                    child.append(a[i])
+            heads = (mask >> i) & 1
+            if i < len(plans_a) and i < len(plans_b):
+                child.add(plans_a[i] if heads else plans_b[i])
+            elif i < len(plans_a):
+                if heads:
+                    child.add(plans_a[i])
             else:
-                if self.random.random() < 0.5:
-                    child.append(b[i])
+                if heads:
+                    child.add(plans_b[i])
         return child
 
     def _mutate(
         self,
-        plans: List[MutationPlan],
+        ind: _Individual,
         templates: List,
         target_map: Dict[str, List[Path]],
         intensity: str,
-    ) -> List[MutationPlan]:
-        if not plans or self.random.random() > self.mutation_rate:
-            return plans
-        plans = list(plans)  # copy to avoid mutating parent
+    ) -> _Individual:
+        if not ind.plans or self.random.random() > self.mutation_rate:
+            return ind
+        ind = ind.copy()  # copy to avoid mutating parent
 
         # Either swap a target, add a new template, or remove one
-        action = self.random.choice(["swap", "add", "remove"])
+        action = self.random.choice(_MUTATE_ACTIONS)
 
-        if action == "swap" and plans:
-            idx = self.random.randrange(len(plans))
-            tmpl = plans[idx].template
+        if action == "swap" and ind.plans:
+            idx = self.random.randrange(len(ind.plans))
+            tmpl = ind.plans[idx].template
             targets = target_map.get(tmpl.id, [])
             if targets:
-                plans[idx] = MutationPlan(
-                    template=tmpl,
-                    target_path=self.random.choice(targets),
-                    intensity=intensity,
+                ind.replace_at(
+                    idx,
+                    MutationPlan(
+                        template=tmpl,
+                        target_path=self.random.choice(targets),
+                        intensity=intensity,
+                    ),
                 )
         elif action == "add":
             available = [t for t in templates if t.id in target_map]
             if available:
                 tmpl = self.random.choice(available)
                 targets = target_map[tmpl.id]
-                plans.append(
+                ind.add(
                     MutationPlan(
                         template=tmpl,
                         target_path=self.random.choice(targets),
                         intensity=intensity,
                     )
                 )
-        elif action == "remove" and len(plans) > 1:
-            idx = self.random.randrange(len(plans))
-            plans.pop(idx)
+        elif action == "remove" and len(ind.plans) > 1:
+            idx = self.random.randrange(len(ind.plans))
+            ind.remove_at(idx)
 
-        return plans
+        return ind
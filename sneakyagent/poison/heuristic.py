@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
 
 from sneakyagent.models import MutationPlan, ScanResult
 from sneakyagent.poison.catalog import RuleCatalog
 from sneakyagent.poison.strategy import Strategy
+from sneakyagent.utils import compile_globs
 
 
 class HeuristicStrategy(Strategy):
@@ -31,8 +32,13 @@ class HeuristicStrategy(Strategy):
             limit = None  # no limit
         else:
             limit = 3
+        # Each layer's files are stringified once per plan() call; templates
+        # sharing a layer reuse the same list.
+        layer_strs: Dict[str, Tuple[List[Path], List[str]]] = {}
         for template in templates:
-            candidates = self._candidates(scan, template.layer, template.target_globs)
+            candidates = self._candidates(
+                scan, template.layer, template.target_globs, layer_strs
+            )
             selected = candidates if limit is None else candidates[:limit]
             for target in selected:
                 plans.append(
@@ -44,14 +50,24 @@ class HeuristicStrategy(Strategy):
                 )
         return plans
 
-    def _candidates(self, scan: ScanResult, layer: str, globs: List[str]) -> List[Path]:
+    def _candidates(
+        self,
+        scan: ScanResult,
+        layer: str,
+        globs: List[str],
+        layer_strs: Dict[str, Tuple[List[Path], List[str]]],
+    ) -> List[Path]:
         layer_files = scan.layers.get(layer, [])
         if not globs:
             return list(layer_files)
-        filtered: List[Path] = []
-        for path in layer_files:
-            for pattern in globs:
-                if path.match(pattern):
-                    filtered.append(path)
-                    break
-        return filtered
+        cached = layer_strs.get(layer)
+        if cached is None:
+            cached = layer_strs[layer] = (
+                list(layer_files),
+                [p.as_posix() for p in layer_files],
+            )
+        files, strings = cached
+        # One cached compiled alternation per glob set instead of re-parsing
+        # every pattern through Path.match for every file.
+        regex = compile_globs(tuple(globs))
+        return [files[i] for i, rel in enumerate(strings) if regex.match(rel)]
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import List, Tuple
 
 from sneakyagent.models import InsertTemplate
 
+# (template, target file, intensity) — one entry per insert plan
+GenerateJob = Tuple[InsertTemplate, Path, str]
+
 
 class PoisonLLMAdapter(ABC):
     @abstractmethod
@@ -14,6 +19,20 @@ class PoisonLLMAdapter(ABC):
     ) -> str:
         raise NotImplementedError
 
+    def generate_many(self, jobs: List[GenerateJob]) -> List[str | Exception]:
+        """Generate content for several plans; failures come back in place.
+
+        The default runs jobs serially; adapters backed by a network API
+        should override this with a concurrent implementation.
+        """
+        results: List[str | Exception] = []
+        for template, target_path, intensity in jobs:
+            try:
+                results.append(self.generate(template, target_path, intensity))
+            except Exception as exc:
+                results.append(exc)
+        return results
+
 
 class NoopPoisonLLMAdapter(PoisonLLMAdapter):
     def generate(
@@ -27,28 +46,54 @@ class NoopPoisonLLMAdapter(PoisonLLMAdapter):
 class OpenAIPoisonLLMAdapter(PoisonLLMAdapter):
     """Generate context-aware mutation content using an OpenAI-compatible API."""
 
+    MAX_CONCURRENCY = 8
+
     def __init__(
         self,
         model: str = "gpt-4o-mini",
         api_key: str | None = None,
         base_url: str | None = None,
     ) -> None:
-        from openai import OpenAI
+        from openai import AsyncOpenAI
 
         self.model = model
-        self.client = OpenAI(
+        self.client = AsyncOpenAI(
             api_key=api_key or os.environ.get("OPENAI_API_KEY", ""),
             base_url=base_url or os.environ.get("OPENAI_BASE_URL"),
         )
 
     def generate(
         self, template: InsertTemplate, target_path: Path, intensity: str
+    ) -> str:
+        return asyncio.run(self._generate_async(template, target_path, intensity))
+
+    def generate_many(self, jobs: List[GenerateJob]) -> List[str | Exception]:
+        # All requests fly concurrently (capped by a semaphore), so N plans
+        # cost roughly max(latency) instead of sum(latency).
+        return asyncio.run(self._generate_many_async(jobs))
+
+    async def _generate_many_async(
+        self, jobs: List[GenerateJob]
+    ) -> List[str | Exception]:
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        async def _one(job: GenerateJob) -> str:
+            async with semaphore:
+                return await self._generate_async(*job)
+
+        return await asyncio.gather(
+            *(_one(job) for job in jobs), return_exceptions=True
+        )
+
+    async def _generate_async(
+        self, template: InsertTemplate, target_path: Path, intensity: str
     ) -> str:
         file_content = ""
         try:
-            file_content = target_path.read_text(encoding="utf-8", errors="ignore")[
-                :3000
-            ]
+            # Only the first 3000 chars go into the prompt, so don't pull
+            # the rest of the file off disk at all.
+            with target_path.open("r", encoding="utf-8", errors="ignore") as f:
+                file_content = f.read(3000)
         except (OSError, PermissionError):
             pass
 
@@ -76,7 +121,7 @@ class OpenAIPoisonLLMAdapter(PoisonLLMAdapter):
             f"\nGenerate a context-aware mutation note for this specific file."
         )
 
-        response = self.client.chat.completions.create(
+        response = await self.client.chat.completions.create(
             model=self.model,
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -1,13 +1,57 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable
 
 
+# Comment prefix per file type, computed from one suffix lookup instead of
+# a chain of _is_* helper calls.
+_COMMENT_BY_SUFFIX = {
+    ".py": "#",
+    ".js": "//",
+    ".ts": "//",
+    ".jsx": "//",
+    ".tsx": "//",
+    ".tf": "#",
+    ".hcl": "#",
+    ".toml": "#",
+    ".yml": "#",
+    ".yaml": "#",
+    ".env": "#",
+}
+_SPECIAL_NAMES = {
+    "Dockerfile": "#",
+    "docker-compose.yml": "#",
+}
+
+# One C-level scan over the filename instead of a substring test per needle.
+# "security" subsumes "security_group" for a boolean match.
+_SENSITIVE_RE = re.compile(
+    r"auth|security|validator|crypto|session|jwt|iam|password|network"
+    r"|firewall|acl|policy|encrypt|ingress|egress"
+)
+
+
+@lru_cache(maxsize=256)
+def _compile_replacements(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    # One alternation with a named group per rule; the group index in
+    # match.lastgroup tells us which replacement to emit. Cached so each
+    # template's pattern set is compiled once per process.
+    return re.compile(
+        "|".join(f"(?P<r{i}>{re.escape(p)})" for i, p in enumerate(patterns))
+    )
+
+
 class MutationOps:
-    def apply_insert(self, path: Path, content: str, intensity: str) -> str | None:
-        original = path.read_text(encoding="utf-8")
-        if content.strip() in original:
+    def apply_insert(
+        self, path: Path, original: str, content: str, intensity: str
+    ) -> str | None:
+        # A needle longer than the haystack can't be present; skip the
+        # substring scan entirely in that case.
+        needle = content.strip()
+        if len(needle) <= len(original) and needle in original:
             return None
 
         # Gate: code files are only mutated based on intensity + sensitivity
@@ -30,42 +74,44 @@ class MutationOps:
         return original.rstrip() + "\n" + payload + "\n"
 
     def apply_replace(
-        self, path: Path, replacements: Iterable[tuple[str, str]], intensity: str
+        self, original: str, replacements: Iterable[tuple[str, str]], intensity: str
     ) -> str | None:
-        original = path.read_text(encoding="utf-8")
-        updated = original
+        replacements = list(replacements)
+        if not replacements:
+            return None
         count = self._replacement_count(intensity)
-        changes = 0
-        for pattern, replacement in replacements:
-            before = updated
-            if count < 0:
-                updated = updated.replace(pattern, replacement)
-            else:
-                updated = updated.replace(pattern, replacement, count)
-            if updated != before:
-                changes += 1
-        if changes == 0:
+        # Single pass over the content instead of one full scan per rule;
+        # per-rule replacement budgets are tracked in `remaining`.
+        regex = _compile_replacements(tuple(p for p, _ in replacements))
+        targets = [r for _, r in replacements]
+        remaining = [count] * len(replacements)
+
+        def _sub(match: re.Match[str]) -> str:
+            i = int(match.lastgroup[1:])  # type: ignore[index]
+            if remaining[i] == 0:
+                return match.group()
+            if remaining[i] > 0:
+                remaining[i] -= 1
+            return targets[i]
+
+        updated = regex.sub(_sub, original)
+        if updated == original:
             return None
         return updated
 
     def _format_payload(self, path: Path, content: str, intensity: str) -> str | None:
         content = self._trim_by_intensity(content, intensity)
 
-        if self._is_markdown(path):
+        suffix = path.suffix.lower()
+        if suffix == ".md":
             return "## Context\n\n" + content
-
-        if self._is_python(path):
-            return self._comment_block("#", content)
-        if self._is_js_ts(path):
-            return self._comment_block("//", content)
-        if self._is_terraform(path):
-            return self._comment_block("#", content)
-        if self._is_toml_yaml_env_docker(path):
-            return self._comment_block("#", content)
-        if self._is_json(path):
+        if suffix == ".json":
             return None
 
-        return self._comment_block("#", content)
+        prefix = (
+            _COMMENT_BY_SUFFIX.get(suffix) or _SPECIAL_NAMES.get(path.name) or "#"
+        )
+        return self._comment_block(prefix, content)
 
     def _trim_by_intensity(self, content: str, intensity: str) -> str:
         lines = [line.strip() for line in content.strip().splitlines() if line.strip()]
@@ -102,13 +148,7 @@ class MutationOps:
         return self._is_python(path) or self._is_js_ts(path) or self._is_terraform(path)
 
     def _is_sensitive_code(self, path: Path) -> bool:
-        name = path.name.lower()
-        needles = (
-            "auth", "security", "validator", "crypto", "session", "jwt",
-            "security_group", "iam", "password", "network", "firewall",
-            "acl", "policy", "encrypt", "ingress", "egress",
-        )
-        return any(token in name for token in needles)
+        return _SENSITIVE_RE.search(path.name.lower()) is not None
 
     def _is_json(self, path: Path) -> bool:
         return path.suffix.lower() == ".json"
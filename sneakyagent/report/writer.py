@@ -1,64 +1,92 @@
 from __future__ import annotations
 
 import json
+from collections import defaultdict
 from dataclasses import asdict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from sneakyagent.analyze.analyzer import Finding
-from sneakyagent.utils import write_text
+from sneakyagent.utils import ensure_dir, write_text
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json works fine without it
+    orjson = None
 
 
 class ReportWriter:
     def to_json(self, findings: List[Finding]) -> str:
         payload = [asdict(f) for f in findings]
+        if orjson is not None:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
         return json.dumps(payload, indent=2, ensure_ascii=True)
 
-    def to_markdown(
+    def write_json(self, path: Path, findings: List[Finding]) -> None:
+        """Serialize findings straight to disk without building a string."""
+        ensure_dir(path.parent)
+        with path.open("w", encoding="utf-8") as fp:
+            # default= converts each Finding lazily as the encoder reaches
+            # it, so no [asdict(f) ...] list is materialized up front.
+            json.dump(findings, fp, default=asdict, indent=2, ensure_ascii=True)
+
+    def iter_markdown(
         self,
         findings: List[Finding],
         diff_findings: Optional[List[Finding]] = None,
-    ) -> str:
-        lines = ["# SneakyAgent Report", ""]
+    ) -> Iterator[str]:
+        yield "# SneakyAgent Report\n\n"
 
         if not findings and not diff_findings:
-            lines.append("No findings.\n")
-            return "\n".join(lines)
+            yield "No findings.\n"
+            return
 
-        if findings:
-            lines.append("## Findings")
-            lines.append("")
-            by_sev = self._group_by_severity(findings)
-            for sev in ["high", "medium", "low"]:
-                items = by_sev.get(sev, [])
-                if items:
-                    lines.append(f"### {sev.upper()} ({len(items)})")
-                    for f in items:
-                        lines.append(f"- **{f.rule_id}**: {f.snippet}")
-                    lines.append("")
-        else:
-            lines.append("## Findings\n\nNo findings.\n")
+        yield from self._iter_section("Findings", findings, "No findings.")
+        yield from self._iter_section(
+            "Drift Findings", diff_findings, "No drift findings."
+        )
+
+    def to_markdown(
+        self,
+        findings: List[Finding],
+        diff_findings: Optional[List[Finding]] = None,
+    ) -> str:
+        return "".join(self.iter_markdown(findings, diff_findings))
 
-        if diff_findings:
-            lines.append("## Drift Findings")
-            lines.append("")
-            by_sev = self._group_by_severity(diff_findings)
-            for sev in ["high", "medium", "low"]:
-                items = by_sev.get(sev, [])
-                if items:
-                    lines.append(f"### {sev.upper()} ({len(items)})")
-                    for f in items:
-                        lines.append(f"- **{f.rule_id}**: {f.snippet}")
-                    lines.append("")
-        else:
-            lines.append("## Drift Findings\n\nNo drift findings.\n")
+    def write_markdown(
+        self,
+        path: Path,
+        findings: List[Finding],
+        diff_findings: Optional[List[Finding]] = None,
+    ) -> None:
+        """Stream the markdown report to disk chunk by chunk."""
+        ensure_dir(path.parent)
+        with path.open("w", encoding="utf-8") as fp:
+            fp.writelines(self.iter_markdown(findings, diff_findings))
 
-        return "\n".join(lines)
+    def _iter_section(
+        self,
+        title: str,
+        findings: Optional[List[Finding]],
+        empty_message: str,
+    ) -> Iterator[str]:
+        if not findings:
+            yield f"## {title}\n\n{empty_message}\n"
+            return
+        yield f"## {title}\n\n"
+        by_sev = self._group_by_severity(findings)
+        for sev in ("high", "medium", "low"):
+            items = by_sev.get(sev)
+            if items:
+                yield f"### {sev.upper()} ({len(items)})\n"
+                # One join per severity bucket instead of a yield per item
+                yield "".join(f"- **{f.rule_id}**: {f.snippet}\n" for f in items)
+                yield "\n"
 
     def _group_by_severity(self, findings: List[Finding]) -> Dict[str, List[Finding]]:
-        by_sev: Dict[str, List[Finding]] = {}
+        by_sev: Dict[str, List[Finding]] = defaultdict(list)
         for f in findings:
-            by_sev.setdefault(f.severity, []).append(f)
+            by_sev[f.severity].append(f)
         return by_sev
 
     def write(self, path: Path, content: str) -> None:
@@ -1,14 +1,91 @@
 from __future__ import annotations
 
+import glob as _glob
+import os
+import re
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterator, List, Tuple
 
 from sneakyagent.models import ScanResult
+from sneakyagent.utils import compile_globs, ensure_dir, read_json, write_json
+
+
+class _LayerView(Mapping):
+    """Lazy per-layer view over one flat ``(layer bitmap, path string)`` list.
+
+    The scan stores each matched file exactly once with a bitmask of the
+    layers it belongs to; a layer's Path list is only materialized (and
+    then cached) when a consumer actually asks for it. Supports the same
+    ``.get``/``.items`` access the old dict-of-lists offered.
+    """
+
+    def __init__(self, names: Tuple[str, ...], flat: List[Tuple[int, str]]) -> None:
+        self._names = names
+        self._bits = {name: 1 << i for i, name in enumerate(names)}
+        self._flat = flat
+        self._cache: Dict[str, List[Path]] = {}
+
+    def __getitem__(self, name: str) -> List[Path]:
+        bit = self._bits.get(name)
+        if bit is None:
+            raise KeyError(name)
+        got = self._cache.get(name)
+        if got is None:
+            got = self._cache[name] = [
+                Path(abs_str) for mask, abs_str in self._flat if mask & bit
+            ]
+        return got
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+@lru_cache(maxsize=None)
+def _dispatch_tables() -> Tuple[
+    Dict[str, int], Dict[str, int], List[Tuple[int, "re.Pattern[str]"]]
+]:
+    """Build the name/extension/regex dispatch tables once per process.
+
+    Every RepoScanner instance shares the same tables; batch jobs that
+    construct a scanner per repo pay the classification and compile cost
+    a single time. Values are layer bitmasks, so classification is a
+    couple of dict lookups plus ``|=`` — duplicates collapse for free.
+    Glob translation itself is additionally memoized in
+    utils.translate_glob.
+    """
+    bit = {layer: 1 << i for i, layer in enumerate(RepoScanner.LAYER_GLOBS)}
+    by_name: Dict[str, int] = {}
+    by_ext: Dict[str, int] = {}
+    layer_res: List[Tuple[int, re.Pattern[str]]] = []
+    for layer, patterns in RepoScanner.LAYER_GLOBS.items():
+        leftovers: List[str] = []
+        for pattern in patterns:
+            if "/" not in pattern and not _glob.has_magic(pattern):
+                by_name[pattern] = by_name.get(pattern, 0) | bit[layer]
+            elif (
+                pattern.startswith("**/*.")
+                and "/" not in pattern[5:]
+                and not _glob.has_magic(pattern[5:])
+            ):
+                ext = pattern[5:]
+                by_ext[ext] = by_ext.get(ext, 0) | bit[layer]
+            else:
+                leftovers.append(pattern)
+        if leftovers:
+            layer_res.append((bit[layer], compile_globs(tuple(leftovers))))
+    return by_name, by_ext, layer_res
 
 
 class RepoScanner:
     DEFAULT_IGNORES = {
         ".git",
+        ".sneakyagent",
         ".hg",
         ".svn",
         ".idea",
@@ -88,19 +165,138 @@ class RepoScanner:
         ],
     }
 
+    def __init__(self) -> None:
+        # Most globs are either a plain basename (README.md) or an
+        # extension sweep (**/*.py). Those dispatch through dict lookups;
+        # only the leftovers need a compiled alternation per layer. The
+        # basename bucket keeps Path.match's right-anchored semantics:
+        # a literal name matched at any depth. Tables are built once per
+        # process and shared between instances.
+        self._by_name, self._by_ext, self._layer_res = _dispatch_tables()
+
     def scan(self, repo_path: Path) -> ScanResult:
-        layers: Dict[str, List[Path]] = {k: [] for k in self.LAYER_GLOBS}
-        for path in self._iter_files(repo_path):
-            relative = path.relative_to(repo_path)
-            for layer, patterns in self.LAYER_GLOBS.items():
-                if any(relative.match(p) for p in patterns):
-                    layers[layer].append(path)
-        return ScanResult(repo_path=repo_path, layers=layers)
-
-    def _iter_files(self, root: Path) -> Iterable[Path]:
-        for path in root.rglob("*"):
-            if not path.is_file():
-                continue
-            if any(part in self.DEFAULT_IGNORES for part in path.parts):
-                continue
-            yield path
+        flat: List[Tuple[int, str]] = []
+        names = tuple(self.LAYER_GLOBS)
+
+        # Directory listings are cached per run under .sneakyagent keyed
+        # by dir mtime_ns: on a rescan, unchanged directories reuse the
+        # persisted name lists instead of paying readdir again. A dir's
+        # mtime changes whenever entries are added/removed/renamed, which
+        # is exactly what classification depends on.
+        cache_path = repo_path / ".sneakyagent" / "scan-cache.json"
+        try:
+            cache: Dict[str, dict] = read_json(cache_path).get("dirs", {})
+        except (OSError, ValueError):
+            cache = {}
+        updates: Dict[str, dict] = {}
+
+        # List the repo root here, then fan the top-level subtrees out to
+        # a thread pool: the GIL is released during scandir/stat syscalls
+        # and for regex matching on strings, so walk + classification
+        # overlap across subtrees. map() preserves submission order, so
+        # results stay deterministic.
+        # Bind the per-file callables to locals once; the inner loops run
+        # N·files times and each dotted lookup there costs a LOAD_ATTR.
+        classify = self._classify
+        list_dir = self._list_dir
+        join = os.path.join
+
+        root_str = str(repo_path)
+        files, subdir_names = list_dir(root_str, ".", cache, updates)
+        for name in files:
+            mask = classify(name)
+            if mask:
+                flat.append((mask, join(root_str, name)))
+
+        if subdir_names:
+            def _subtree(name: str) -> List[Tuple[int, str]]:
+                part: List[Tuple[int, str]] = []
+                append = part.append
+                stack = [(join(root_str, name), name + "/")]
+                while stack:
+                    dirpath, prefix = stack.pop()
+                    sub_files, sub_dirs = list_dir(
+                        dirpath, prefix.rstrip("/"), cache, updates
+                    )
+                    for fname in sub_files:
+                        mask = classify(prefix + fname)
+                        if mask:
+                            append((mask, join(dirpath, fname)))
+                    for dname in sub_dirs:
+                        stack.append(
+                            (join(dirpath, dname), prefix + dname + "/")
+                        )
+                return part
+
+            workers = min(len(subdir_names), 32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for part in pool.map(_subtree, subdir_names):
+                    flat.extend(part)
+
+        if updates:
+            cache.update(updates)
+            try:
+                ensure_dir(cache_path.parent)
+                write_json(cache_path, {"dirs": cache})
+            except OSError:
+                pass  # cache is best-effort; the scan result is complete
+
+        return ScanResult(repo_path=repo_path, layers=_LayerView(names, flat))
+
+    def _list_dir(
+        self,
+        dirpath: str,
+        key: str,
+        cache: Dict[str, dict],
+        updates: Dict[str, dict],
+    ) -> Tuple[List[str], List[str]]:
+        """List one directory's (files, subdirs), reusing the persisted
+        cache entry when the directory's mtime_ns is unchanged.
+
+        This deliberately stays a stat-then-scandir walk rather than an
+        os.fwalk/dir_fd traversal: fwalk always re-lists every directory,
+        which would defeat the mtime cache, and the scanner never opens
+        the files it classifies, so there are no follow-up syscalls that
+        could reuse a directory fd.
+        """
+        try:
+            mtime_ns = os.stat(dirpath).st_mtime_ns
+        except OSError:
+            return [], []
+        entry = cache.get(key)
+        if entry is not None and entry.get("mtime_ns") == mtime_ns:
+            return entry["files"], entry["subdirs"]
+
+        files: List[str] = []
+        subdirs: List[str] = []
+        try:
+            entries = os.scandir(dirpath)
+        except OSError:
+            return [], []
+        with entries:
+            for e in entries:
+                if e.name in self.DEFAULT_IGNORES:
+                    continue
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        subdirs.append(e.name)
+                    elif e.is_file(follow_symlinks=False):
+                        files.append(e.name)
+                except OSError:
+                    continue
+        updates[key] = {"mtime_ns": mtime_ns, "files": files, "subdirs": subdirs}
+        return files, subdirs
+
+    def _classify(self, rel_str: str) -> int:
+        """Return the bitmask of layers this relative path belongs to."""
+        name = rel_str.rsplit("/", 1)[-1]
+        mask = self._by_name.get(name, 0)
+        dot = name.rfind(".")
+        if dot != -1:
+            ext_mask = self._by_ext.get(name[dot + 1 :])
+            if ext_mask:
+                mask |= ext_mask
+        for bit, regex in self._layer_res:
+            if not mask & bit and regex.match(rel_str):
+                mask |= bit
+        return mask
@@ -1,55 +1,143 @@
 from __future__ import annotations
 
-import json
-from dataclasses import asdict
+import hashlib
+import os
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, List, Tuple
 
 from sneakyagent.models import FileMutation, RunManifest
-from sneakyagent.utils import ensure_dir, write_json, write_text
+from sneakyagent.utils import (
+    ensure_dir,
+    file_digest,
+    read_json,
+    write_json,
+    write_text,
+)
+
+# New or deleted files hash empty content; compute that digest once.
+_EMPTY_DIGEST = hashlib.blake2b(b"", digest_size=16).hexdigest()
 
 
 class RunStore:
+    # Artifact absolute path -> (mtime_ns, text). Class-level because the
+    # CLI constructs a fresh RunStore per run id: the store that wrote a
+    # baseline artifact is never the one that reads it back.
+    _artifact_cache: Dict[str, Tuple[int, str]] = {}
+
     def __init__(self, repo_path: Path, run_id: str) -> None:
         self.repo_path = repo_path
         self.run_id = run_id
         self.base_dir = repo_path / ".sneakyagent" / "runs" / run_id
         self.backup_dir = self.base_dir / "backup"
         self.artifacts_dir = self.base_dir / "artifacts"
+        # target path -> first backup holding identical content
+        self._backup_dedup: Dict[Path, Path] = {}
         ensure_dir(self.backup_dir)
         ensure_dir(self.artifacts_dir)
 
     def save_manifest(self, manifest: RunManifest) -> None:
         manifest_path = self.base_dir / "manifest.json"
-        payload = asdict(manifest)
-        payload["repo_path"] = str(manifest.repo_path)
-        payload["mutations"] = [
-            {
+        entries = []
+        for m in manifest.mutations:
+            entry = {
                 "target_path": str(m.target_path),
                 "template_id": m.template_id,
-                "before_sha256": self._sha(m.before),
-                "after_sha256": self._sha(m.after),
+                "before_blake2b": m.before_sha or self._sha(m.before),
+                "after_blake2b": m.after_sha or self._sha(m.after),
             }
-            for m in manifest.mutations
-        ]
+            dedup_of = self._backup_dedup.get(m.target_path)
+            if dedup_of is not None:
+                entry["dedup_of"] = str(dedup_of)
+            entries.append(entry)
+        # Built by hand: asdict() would deep-copy every mutation —
+        # including the full before/after file bodies — only for the
+        # result to be thrown away and replaced with the digest entries.
+        payload = {
+            "run_id": manifest.run_id,
+            "repo_path": str(manifest.repo_path),
+            "created_at": manifest.created_at,
+            "strategy": manifest.strategy,
+            "categories": manifest.categories,
+            "intensity": manifest.intensity,
+            "layer_level": manifest.layer_level,
+            "mutations": entries,
+            "meta": manifest.meta,
+        }
         write_json(manifest_path, payload)
 
     def save_backups(self, mutations: List[FileMutation]) -> None:
-        for mutation in mutations:
-            relative = mutation.target_path.relative_to(self.repo_path)
-            backup_path = self.backup_dir / relative
-            ensure_dir(backup_path.parent)
-            write_text(backup_path, mutation.before)
+        # Content-addressed dedup: identical before-content (templates
+        # rewriting sibling files with the same header) is stored once and
+        # duplicates become symlinks to the first copy.
+        backup_paths = [
+            self.backup_dir / mutation.target_path.relative_to(self.repo_path)
+            for mutation in mutations
+        ]
+        # One mkdir pass per unique parent instead of per mutation;
+        # sibling files share the same directory almost always.
+        for parent in {path.parent for path in backup_paths}:
+            ensure_dir(parent)
+
+        seen: Dict[str, Path] = {}
+        for mutation, backup_path in zip(mutations, backup_paths):
+            # Encode once: the same bytes are hashed (to stash digests for
+            # save_manifest and to decide dedup) and written to the backup.
+            before_bytes = mutation.before.encode("utf-8")
+            digest = hashlib.blake2b(before_bytes, digest_size=16).hexdigest()
+            mutation.before_sha = digest
+            mutation.after_sha = file_digest(mutation.after)
+
+            first = seen.get(digest)
+            if first is not None and first != backup_path:
+                try:
+                    backup_path.unlink(missing_ok=True)
+                    # Link relative to the symlink's own directory: a
+                    # target spelled like the (possibly cwd-relative)
+                    # repo_path would dangle, and relative links survive
+                    # the backup tree being moved or archived.
+                    backup_path.symlink_to(
+                        os.path.relpath(first, backup_path.parent)
+                    )
+                    self._backup_dedup[mutation.target_path] = first
+                    continue
+                except OSError:
+                    pass  # symlinks unsupported: fall back to a real copy
+            backup_path.write_bytes(before_bytes)
+            seen[digest] = backup_path
 
     def save_artifact(self, name: str, content: str) -> None:
         path = self.artifacts_dir / name
         write_text(path, content)
+        # Prime the cache so a later load in the same process skips disk.
+        key = os.path.abspath(path)
+        RunStore._artifact_cache[key] = (path.stat().st_mtime_ns, content)
+
+    def load_artifact_text(self, name: str) -> str:
+        """Read an artifact, reusing the in-memory copy as long as the file
+        on disk is unchanged (same mtime_ns)."""
+        path = self.artifacts_dir / name
+        key = os.path.abspath(path)
+        mtime_ns = path.stat().st_mtime_ns
+        cached = self._artifact_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        text = path.read_text(encoding="utf-8")
+        RunStore._artifact_cache[key] = (mtime_ns, text)
+        return text
+
+    def save_artifact_lines(self, name: str, lines: Iterable[str]) -> None:
+        path = self.artifacts_dir / name
+        with path.open("w", encoding="utf-8") as fh:
+            for line in lines:
+                fh.write(line)
+                fh.write("\n")
 
     def load_manifest(self) -> dict:
         manifest_path = self.base_dir / "manifest.json"
-        return json.loads(manifest_path.read_text(encoding="utf-8"))
-
-    def _sha(self, content: str) -> str:
-        import hashlib
+        return read_json(manifest_path)
 
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    @staticmethod
+    def _sha(content: str) -> str:
+        if not content:
+            return _EMPTY_DIGEST
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
@@ -2,17 +2,40 @@ from __future__ import annotations
 
 import hashlib
 import json
-from datetime import datetime, timezone
+import os
+import re
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json works fine without it
+    orjson = None
+
+try:
+    import re2  # linear-time matching for the big glob alternations
+except ImportError:  # optional; stdlib re handles the same patterns
+    re2 = None
 
 
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    # Same format as datetime.now(timezone.utc).isoformat() without
+    # building datetime/tzinfo objects per call.
+    now = time.time()
+    g = time.gmtime(now)
+    micros = int((now - int(now)) * 1_000_000)
+    return (
+        f"{g.tm_year:04d}-{g.tm_mon:02d}-{g.tm_mday:02d}"
+        f"T{g.tm_hour:02d}:{g.tm_min:02d}:{g.tm_sec:02d}.{micros:06d}+00:00"
+    )
 
 
-def file_sha256(content: str) -> str:
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+def file_digest(content: str) -> str:
+    # BLAKE2b-128: these digests only fingerprint content for change
+    # detection, so a short, faster hash beats full SHA-256.
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def ensure_dir(path: Path) -> None:
@@ -28,4 +51,111 @@ def read_text(path: Path) -> str:
 
 
 def write_json(path: Path, data: Dict[str, Any]) -> None:
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=True), encoding="utf-8")
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    # ensure_ascii=False lets the encoder emit raw UTF-8 instead of
+    # \u-escaping every non-ASCII codepoint (e.g. non-English paths).
+    path.write_bytes(
+        json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    )
+
+
+def read_json(path: Path) -> Any:
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def iter_files(root: Path, ignore: Set[str]) -> Iterator[Tuple[str, str]]:
+    """Yield ``(relative_posix, absolute)`` path-string pairs for every
+    file below ``root``, pruning ignored directory names before
+    descending into them.
+
+    Uses an explicit ``os.scandir`` stack so directory-entry type checks
+    reuse the dirent data from the listing instead of issuing one stat
+    per path, and ignored trees are never entered at all. Working in
+    string space keeps per-file Path construction and ``relative_to``
+    re-walks off the hot path; relative paths are sliced straight from
+    ``DirEntry.path``.
+    """
+    root_str = str(root)
+    prefix = len(root_str) if root_str.endswith(os.sep) else len(root_str) + 1
+    posix_sep = os.sep == "/"
+    stack = [root_str]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name in ignore:
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        rel = entry.path[prefix:]
+                        yield rel if posix_sep else rel.replace(os.sep, "/"), entry.path
+                except OSError:
+                    continue
+
+
+@lru_cache(maxsize=512)
+def translate_glob(pattern: str) -> str:
+    """Translate one glob pattern into an anchored regex fragment.
+
+    Mirrors ``PurePath.match`` semantics on relative patterns: matching is
+    done from the right, ``*`` and ``?`` never cross a ``/``, and ``**``
+    spans any number of directories.
+    """
+    parts = pattern.split("/")
+    last = len(parts) - 1
+    out = []
+    for i, part in enumerate(parts):
+        if part == "**":
+            out.append(".*" if i == last else "(?:[^/]+/)*")
+            continue
+        segment = ""
+        j = 0
+        while j < len(part):
+            ch = part[j]
+            if ch == "*":
+                segment += "[^/]*"
+            elif ch == "?":
+                segment += "[^/]"
+            elif ch == "[":
+                close = part.find("]", j + 1)
+                if close == -1:
+                    segment += re.escape(ch)
+                else:
+                    segment += part[j : close + 1]
+                    j = close
+            else:
+                segment += re.escape(ch)
+            j += 1
+        out.append(segment if i == last else segment + "/")
+    return r"(?:.*/)?" + "".join(out) + r"\Z"
+
+
+@lru_cache(maxsize=None)
+def compile_globs(patterns: Tuple[str, ...]) -> re.Pattern[str]:
+    r"""Compile several glob patterns into a single alternation regex.
+
+    Prefers google-re2 when installed: its DFA guarantees linear-time
+    matching however many alternatives a layer accumulates. The two
+    engines spell the end-of-text anchor differently (``\z`` in RE2,
+    ``\Z`` in stdlib ``re``), so each gets a source with its own anchor.
+    """
+    fragments = [translate_glob(p) for p in patterns]
+    if re2 is not None:
+        # translate_glob anchors each fragment with the stdlib \Z, which
+        # RE2 rejects outright; swap in its \z spelling before compiling.
+        source = "|".join(f"(?:{frag[:-2]}\\z)" for frag in fragments)
+        try:
+            return re2.compile(source)
+        except Exception:  # pattern outside re2's subset; use stdlib
+            pass
+    return re.compile("|".join(f"(?:{frag})" for frag in fragments))